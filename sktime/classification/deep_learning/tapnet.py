@@ -61,6 +61,22 @@ class TapNetClassifier(BaseDeepClassifier):
         whether to output extra information
     random_state    : int or None, default = None
         seed for random
+    lstm_activation : str, default = "tanh"
+        activation function of the LSTM layer
+    lstm_recurrent_activation : str, default = "sigmoid"
+        activation function for the recurrent step of the LSTM layer
+    lstm_recurrent_dropout : float, default = 0.0
+        dropout rate for the recurrent state of the LSTM layer
+    lstm_unroll     : bool, default = False
+        whether to unroll the LSTM, trading memory for speed on short series
+    lstm_use_bias   : bool, default = True
+        whether to use bias in the LSTM layer; the lstm defaults satisfy
+        the cuDNN fused-kernel criteria, and overriding any of them makes
+        tensorflow fall back to the slower generic GPU kernel
+    checkpoint_attention : bool, default = False
+        whether to recompute the attention activations during the backward
+        pass instead of keeping them in memory, trading a second forward
+        pass through attention for a lower peak memory
 
     Attributes
     ----------
@@ -117,6 +133,12 @@ class TapNetClassifier(BaseDeepClassifier):
         metrics=None,
         callbacks=None,
         verbose=False,
+        lstm_activation="tanh",
+        lstm_recurrent_activation="sigmoid",
+        lstm_recurrent_dropout=0.0,
+        lstm_unroll=False,
+        lstm_use_bias=True,
+        checkpoint_attention=False,
     ):
         _check_dl_dependencies(severity="error")
 
@@ -124,7 +146,6 @@ class TapNetClassifier(BaseDeepClassifier):
         self.random_state = random_state
         self.kernel_size = kernel_size
         self.layers = layers
-        self.rp_params = rp_params
         self.filter_sizes = filter_sizes
         self.activation = activation
         self.use_att = use_att
@@ -138,6 +159,12 @@ class TapNetClassifier(BaseDeepClassifier):
         self.metrics = metrics
         self.callbacks = callbacks
         self.verbose = verbose
+        self.lstm_activation = lstm_activation
+        self.lstm_recurrent_activation = lstm_recurrent_activation
+        self.lstm_recurrent_dropout = lstm_recurrent_dropout
+        self.lstm_unroll = lstm_unroll
+        self.lstm_use_bias = lstm_use_bias
+        self.checkpoint_attention = checkpoint_attention
 
         self.dropout = dropout
         self.use_lstm = use_lstm
@@ -162,6 +189,12 @@ class TapNetClassifier(BaseDeepClassifier):
             use_cnn=self.use_cnn,
             random_state=self.random_state,
             padding=self.padding,
+            lstm_activation=self.lstm_activation,
+            lstm_recurrent_activation=self.lstm_recurrent_activation,
+            lstm_recurrent_dropout=self.lstm_recurrent_dropout,
+            lstm_unroll=self.lstm_unroll,
+            lstm_use_bias=self.lstm_use_bias,
+            checkpoint_attention=self.checkpoint_attention,
         )
 
     def build_model(self, input_shape, n_classes, **kwargs):
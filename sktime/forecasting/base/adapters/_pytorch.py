@@ -9,7 +9,7 @@ from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 if _check_soft_dependencies("torch", severity="none"):
     import torch
-    from torch.utils.data import Dataset
+    from torch.utils.data import DataLoader, Dataset
 else:
 
     class Dataset:
@@ -40,6 +40,12 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
         optimizer=None,
         optimizer_kwargs=None,
         lr=0.001,
+        num_workers=0,
+        pin_memory=False,
+        persistent_workers=False,
+        prefetch_factor=2,
+        compile_model=False,
+        precision="fp32",
     ):
         self.num_epochs = num_epochs
         self.batch_size = batch_size
@@ -49,6 +55,12 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
         self.optimizer = optimizer
         self.optimizer_kwargs = optimizer_kwargs
         self.lr = lr
+        self.num_workers = num_workers
+        self.pin_memory = pin_memory
+        self.persistent_workers = persistent_workers
+        self.prefetch_factor = prefetch_factor
+        self.compile_model = compile_model
+        self.precision = precision
 
         super().__init__()
 
@@ -65,8 +77,38 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
         """
         fh = fh.to_relative(self.cutoff)
 
+        if self.precision not in ("fp32", "bf16"):
+            raise ValueError(
+                '`precision` must be one of "fp32" or "bf16", '
+                f"but found {self.precision!r}."
+            )
+
         self.network = self._build_network(list(fh)[-1])
 
+        if self.compile_model:
+            if not hasattr(torch, "compile"):
+                raise ValueError(
+                    "`compile_model=True` requires torch>=2.0, "
+                    f"but found torch=={torch.__version__}."
+                )
+            # seq_len/pred_len/in_channels are fixed at construction time;
+            # symbolic tracing bakes them into a flat graph (no attribute
+            # reads or branches per call) before compilation specializes it
+            try:
+                traced = torch.fx.symbolic_trace(self.network)
+                # GraphModule only keeps attributes used in the graph, but
+                # the dataloader builders read the window sizes off network
+                traced.seq_len = self.network.seq_len
+                traced.pred_len = self.network.pred_len
+                self.network = traced
+            except Exception:
+                # not all networks are traceable (e.g. data-dependent
+                # control flow); torch.compile handles those directly
+                pass
+            # shapes are fixed at construction time, so the graph can be
+            # specialized and fused once and reused for every batch
+            self.network = torch.compile(self.network, mode="reduce-overhead")
+
         self._criterion = self._instantiate_criterion()
         self._optimizer = self._instantiate_optimizer()
 
@@ -120,8 +162,6 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
 
     def _predict(self, X=None, fh=None):
         """Predict with fitted model."""
-        from torch import cat
-
         if fh is None:
             fh = self.fh
         fh = fh.to_relative(self.cutoff)
@@ -141,10 +181,27 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
         else:
             dataloader = self.build_pytorch_pred_dataloader(X, fh)
 
-        y_pred = []
-        for x, _ in dataloader:
-            y_pred.append(self.network(x).detach())
-        y_pred = cat(y_pred, dim=0).view(-1, y_pred[0].shape[-1]).numpy()
+        # inference_mode disables autograd bookkeeping entirely, which is
+        # cheaper than detaching the outputs after a tracked forward pass
+        self.network.eval()
+        if self.precision == "bf16":
+            # halves the weight bytes loaded per forward; the cast is
+            # idempotent, so repeated predict calls do not re-copy
+            self.network.bfloat16()
+        # write each batch straight into a preallocated output array rather
+        # than collecting tensors and paying concat + contiguous-view +
+        # numpy-copy passes over the full output afterwards
+        n_rows = len(dataloader.dataset) * self.network.pred_len
+        y_pred = np.empty((n_rows, len(self._y.columns)), dtype=np.float32)
+        row = 0
+        with torch.inference_mode():
+            for x, _ in dataloader:
+                if self.precision == "bf16":
+                    x = x.to(torch.bfloat16)
+                batch_pred = self.network(x).float()
+                batch_pred = batch_pred.reshape(-1, batch_pred.shape[-1])
+                y_pred[row : row + batch_pred.shape[0]] = batch_pred.numpy()
+                row += batch_pred.shape[0]
         y_pred = y_pred[fh._values.values - 1]
         y_pred = pd.DataFrame(
             y_pred, columns=self._y.columns, index=fh.to_absolute_index(self.cutoff)
@@ -154,8 +211,6 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
 
     def build_pytorch_train_dataloader(self, y):
         """Build PyTorch DataLoader for training."""
-        from torch.utils.data import DataLoader
-
         if self.custom_dataset_train:
             if hasattr(self.custom_dataset_train, "build_dataset") and callable(
                 self.custom_dataset_train.build_dataset
@@ -169,24 +224,30 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
                     "documentation."
                 )
         else:
-            dataset = PyTorchTrainDataset(
+            dataset = PyTorchWindowDataset(
                 y=y,
                 seq_len=self.network.seq_len,
                 fh=self._fh.to_relative(self.cutoff)._values[-1],
+                batch_size=self.batch_size,
+            )
+            # the dataset yields ready-made batches, so automatic batching
+            # (and its per-sample collate) is disabled via batch_size=None
+            return DataLoader(
+                dataset, batch_size=None, shuffle=True, **self._get_dataloader_kwargs()
             )
 
-        return DataLoader(dataset, self.batch_size, shuffle=True)
+        return DataLoader(
+            dataset, self.batch_size, shuffle=True, **self._get_dataloader_kwargs()
+        )
 
     def build_pytorch_pred_dataloader(self, y, fh):
         """Build PyTorch DataLoader for prediction."""
-        from torch.utils.data import DataLoader
-
         if self.custom_dataset_pred:
             if hasattr(self.custom_dataset_pred, "build_dataset") and callable(
                 self.custom_dataset_pred.build_dataset
             ):
-                self.custom_dataset_train.build_dataset(y)
-                dataset = self.custom_dataset_train
+                self.custom_dataset_pred.build_dataset(y)
+                dataset = self.custom_dataset_pred
             else:
                 raise NotImplementedError(
                     "Custom Dataset `build_dataset` method is not available. Please"
@@ -202,13 +263,35 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
         return DataLoader(
             dataset,
             self.batch_size,
+            **self._get_dataloader_kwargs(),
         )
 
+    def _get_dataloader_kwargs(self):
+        """Collect performance settings shared by train and pred DataLoaders.
+
+        ``persistent_workers`` and ``prefetch_factor`` are only valid when
+        workers are used, so they are only forwarded if ``num_workers > 0``.
+        """
+        dataloader_kwargs = {
+            "num_workers": self.num_workers,
+            "pin_memory": self.pin_memory,
+        }
+        if self.num_workers > 0:
+            dataloader_kwargs["persistent_workers"] = self.persistent_workers
+            dataloader_kwargs["prefetch_factor"] = self.prefetch_factor
+        return dataloader_kwargs
+
     def get_y_true(self, y):
         """Get y_true values for validation."""
-        dataloader = self.build_pytorch_pred_dataloader(y)
-        y_true = [y.flatten().numpy() for _, y in dataloader]
-        return np.concatenate(y_true, axis=0)
+        # the window targets are a stride view on the series, so this is a
+        # single slice-and-copy instead of a full dataloader traversal
+        dataset = PyTorchWindowDataset(
+            y=y,
+            seq_len=self.network.seq_len,
+            fh=self._fh.to_relative(self.cutoff)._values[-1],
+            batch_size=self.batch_size,
+        )
+        return dataset.targets.reshape(-1).numpy()
 
     @abc.abstractmethod
     def _build_network(self, fh):
@@ -216,11 +299,19 @@ class BaseDeepNetworkPyTorch(BaseForecaster, ABC):
 
 
 class PyTorchTrainDataset(Dataset):
-    """Dataset for use in sktime deep learning forecasters."""
+    """Dataset for use in sktime deep learning forecasters.
+
+    The series is converted to a float32 tensor once at construction,
+    so ``__getitem__`` only returns zero-copy views into it.
+    """
 
     def __init__(self, y, seq_len, fh=None, X=None):
-        self.y = y.values
-        self.X = X.values if X is not None else X
+        self.y = torch.from_numpy(y.values.astype("float32", copy=False))
+        self.X = (
+            torch.from_numpy(X.values.astype("float32", copy=False))
+            if X is not None
+            else X
+        )
         self.seq_len = seq_len
         self.fh = fh
 
@@ -230,28 +321,76 @@ class PyTorchTrainDataset(Dataset):
 
     def __getitem__(self, i):
         """Return data point."""
-        from torch import from_numpy, tensor
-
-        hist_y = tensor(self.y[i : i + self.seq_len]).float()
+        hist_y = self.y[i : i + self.seq_len]
         if self.X is not None:
-            exog_data = tensor(
-                self.X[i + self.seq_len : i + self.seq_len + self.fh]
-            ).float()
-        else:
-            exog_data = tensor([])
+            exog_data = self.X[i + self.seq_len : i + self.seq_len + self.fh]
+            hist_y = torch.cat([hist_y, exog_data])
         return (
-            torch.cat([hist_y, exog_data]),
-            from_numpy(self.y[i + self.seq_len : i + self.seq_len + self.fh]).float(),
+            hist_y,
+            self.y[i + self.seq_len : i + self.seq_len + self.fh],
         )
 
 
+class PyTorchWindowDataset(Dataset):
+    """Batched sliding-window dataset for sktime deep learning forecasters.
+
+    All ``seq_len + fh`` windows are computed once at construction via
+    ``unfold`` — a stride trick that does not copy the series — and
+    ``__getitem__`` returns ``batch_size`` windows at a time. This bypasses
+    the DataLoader's per-sample collate; pass ``batch_size=None`` to the
+    DataLoader so the batches are not re-collated.
+
+    Batches are assembled through a random index permutation, so each one
+    mixes windows from across the series instead of a block of consecutive,
+    highly correlated windows; the DataLoader's ``shuffle=True`` then only
+    randomizes the batch order.
+    """
+
+    def __init__(self, y, seq_len, fh, batch_size):
+        y_t = torch.from_numpy(y.values.astype("float32", copy=False))
+        window_len = seq_len + fh
+        if len(y_t) >= window_len:
+            # (n_windows, n_channels, window_len) -> (n_windows, window_len, n_channels)
+            self.windows = y_t.unfold(0, window_len, 1).permute(0, 2, 1)
+        else:
+            self.windows = y_t.new_empty((0, window_len, y_t.shape[-1]))
+        self.seq_len = seq_len
+        self.fh = fh
+        self.batch_size = batch_size
+        self._permutation = torch.randperm(self.windows.shape[0])
+
+    def __len__(self):
+        """Return number of batches in the dataset."""
+        n_windows = self.windows.shape[0]
+        return (n_windows + self.batch_size - 1) // self.batch_size
+
+    def __getitem__(self, i):
+        """Return one batch of data points."""
+        idx = self._permutation[i * self.batch_size : (i + 1) * self.batch_size]
+        batch = self.windows[idx]
+        return batch[:, : self.seq_len], batch[:, self.seq_len :]
+
+    @property
+    def targets(self):
+        """Return all prediction targets as one [n_windows, fh, channel] view."""
+        return self.windows[:, self.seq_len :]
+
+
 class PyTorchPredDataset(Dataset):
-    """Dataset for use in sktime deep learning forecasters."""
+    """Dataset for use in sktime deep learning forecasters.
+
+    The series is converted to a float32 tensor once at construction,
+    so ``__getitem__`` only returns zero-copy views into it.
+    """
 
     def __init__(self, y, seq_len, X=None):
-        self.y = y.values
+        self.y = torch.from_numpy(y.values.astype("float32", copy=False))
         self.seq_len = seq_len
-        self.X = X.values if X is not None else X
+        self.X = (
+            torch.from_numpy(X.values.astype("float32", copy=False))
+            if X is not None
+            else X
+        )
 
     def __len__(self):
         """Return length of dataset."""
@@ -259,16 +398,11 @@ class PyTorchPredDataset(Dataset):
 
     def __getitem__(self, i):
         """Return data point."""
-        from torch import from_numpy, tensor
-
-        hist_y = tensor(self.y[i : i + self.seq_len]).float()
+        hist_y = self.y[i : i + self.seq_len]
         if self.X is not None:
-            exog_data = tensor(
-                self.X[i + self.seq_len : i + self.seq_len + self.fh]
-            ).float()
-        else:
-            exog_data = tensor([])
+            exog_data = self.X[i + self.seq_len : i + self.seq_len + self.fh]
+            hist_y = torch.cat([hist_y, exog_data])
         return (
-            torch.cat([hist_y, exog_data]),
-            from_numpy(self.y[i + self.seq_len : i + self.seq_len]).float(),
+            hist_y,
+            self.y[i + self.seq_len : i + self.seq_len],
         )
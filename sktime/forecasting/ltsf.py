@@ -39,6 +39,26 @@ class LTSFLinearForecaster(BaseDeepNetworkPyTorch):
         keyword arguments to pass to optimizer
     lr : float, default=0.003
         learning rate to train model with
+    num_workers : int, default=0
+        number of subprocesses used by the DataLoaders to load batches in
+        parallel, 0 means loading in the main process
+    pin_memory : bool, default=False
+        whether the DataLoaders copy tensors into pinned memory before
+        returning them, speeding up host-to-device transfer on GPU
+    persistent_workers : bool, default=False
+        whether worker processes are kept alive between epochs,
+        only used if num_workers > 0
+    prefetch_factor : int, default=2
+        number of batches loaded in advance by each worker,
+        only used if num_workers > 0
+    compile_model : bool, default=False
+        whether the network is compiled with torch.compile after it is
+        built, specializing the graph to the fixed seq_len and pred_len,
+        requires torch>=2.0
+    precision : str, default="fp32"
+        numeric precision used for prediction, one of "fp32" or "bf16";
+        "bf16" casts the fitted network to bfloat16 before inference,
+        halving the weight bytes read per forward pass
 
     References
     ----------
@@ -87,6 +107,12 @@ class LTSFLinearForecaster(BaseDeepNetworkPyTorch):
         optimizer=None,
         optimizer_kwargs=None,
         lr=0.001,
+        num_workers=0,
+        pin_memory=False,
+        persistent_workers=False,
+        prefetch_factor=2,
+        compile_model=False,
+        precision="fp32",
         custom_dataset_train=None,
         custom_dataset_pred=None,
     ):
@@ -103,6 +129,12 @@ class LTSFLinearForecaster(BaseDeepNetworkPyTorch):
         self.custom_dataset_train = custom_dataset_train
         self.custom_dataset_pred = custom_dataset_pred
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.pin_memory = pin_memory
+        self.persistent_workers = persistent_workers
+        self.prefetch_factor = prefetch_factor
+        self.compile_model = compile_model
+        self.precision = precision
 
         super().__init__(
             num_epochs=num_epochs,
@@ -113,6 +145,12 @@ class LTSFLinearForecaster(BaseDeepNetworkPyTorch):
             optimizer=optimizer,
             optimizer_kwargs=optimizer_kwargs,
             lr=lr,
+            num_workers=num_workers,
+            pin_memory=pin_memory,
+            persistent_workers=persistent_workers,
+            prefetch_factor=prefetch_factor,
+            compile_model=compile_model,
+            precision=precision,
         )
 
         from sktime.utils.validation._dependencies import _check_soft_dependencies
@@ -169,7 +207,15 @@ class LTSFLinearForecaster(BaseDeepNetworkPyTorch):
                 "batch_size": 1,
                 "num_epochs": 1,
                 "individual": True,
-            }
+            },
+            {
+                "seq_len": 2,
+                "pred_len": 1,
+                "batch_size": 1,
+                "num_epochs": 1,
+                "compile_model": True,
+                "precision": "bf16",
+            },
         ]
 
         return params
@@ -211,6 +257,26 @@ class LTSFDLinearForecaster(BaseDeepNetworkPyTorch):
         keyword arguments to pass to optimizer
     lr : float, default=0.003
         learning rate to train model with
+    num_workers : int, default=0
+        number of subprocesses used by the DataLoaders to load batches in
+        parallel, 0 means loading in the main process
+    pin_memory : bool, default=False
+        whether the DataLoaders copy tensors into pinned memory before
+        returning them, speeding up host-to-device transfer on GPU
+    persistent_workers : bool, default=False
+        whether worker processes are kept alive between epochs,
+        only used if num_workers > 0
+    prefetch_factor : int, default=2
+        number of batches loaded in advance by each worker,
+        only used if num_workers > 0
+    compile_model : bool, default=False
+        whether the network is compiled with torch.compile after it is
+        built, specializing the graph to the fixed seq_len and pred_len,
+        requires torch>=2.0
+    precision : str, default="fp32"
+        numeric precision used for prediction, one of "fp32" or "bf16";
+        "bf16" casts the fitted network to bfloat16 before inference,
+        halving the weight bytes read per forward pass
 
     References
     ----------
@@ -250,6 +316,12 @@ class LTSFDLinearForecaster(BaseDeepNetworkPyTorch):
         optimizer=None,
         optimizer_kwargs=None,
         lr=0.001,
+        num_workers=0,
+        pin_memory=False,
+        persistent_workers=False,
+        prefetch_factor=2,
+        compile_model=False,
+        precision="fp32",
         custom_dataset_train=None,
         custom_dataset_pred=None,
     ):
@@ -266,6 +338,12 @@ class LTSFDLinearForecaster(BaseDeepNetworkPyTorch):
         self.custom_dataset_train = custom_dataset_train
         self.custom_dataset_pred = custom_dataset_pred
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.pin_memory = pin_memory
+        self.persistent_workers = persistent_workers
+        self.prefetch_factor = prefetch_factor
+        self.compile_model = compile_model
+        self.precision = precision
 
         super().__init__(
             num_epochs=num_epochs,
@@ -276,6 +354,12 @@ class LTSFDLinearForecaster(BaseDeepNetworkPyTorch):
             optimizer=optimizer,
             optimizer_kwargs=optimizer_kwargs,
             lr=lr,
+            num_workers=num_workers,
+            pin_memory=pin_memory,
+            persistent_workers=persistent_workers,
+            prefetch_factor=prefetch_factor,
+            compile_model=compile_model,
+            precision=precision,
         )
 
         from sktime.utils.validation._dependencies import _check_soft_dependencies
@@ -332,7 +416,15 @@ class LTSFDLinearForecaster(BaseDeepNetworkPyTorch):
                 "batch_size": 1,
                 "num_epochs": 1,
                 "individual": True,
-            }
+            },
+            {
+                "seq_len": 2,
+                "pred_len": 1,
+                "batch_size": 1,
+                "num_epochs": 1,
+                "compile_model": True,
+                "precision": "bf16",
+            },
         ]
 
         return params
@@ -374,6 +466,26 @@ class LTSFNLinearForecaster(BaseDeepNetworkPyTorch):
         keyword arguments to pass to optimizer
     lr : float, default=0.003
         learning rate to train model with
+    num_workers : int, default=0
+        number of subprocesses used by the DataLoaders to load batches in
+        parallel, 0 means loading in the main process
+    pin_memory : bool, default=False
+        whether the DataLoaders copy tensors into pinned memory before
+        returning them, speeding up host-to-device transfer on GPU
+    persistent_workers : bool, default=False
+        whether worker processes are kept alive between epochs,
+        only used if num_workers > 0
+    prefetch_factor : int, default=2
+        number of batches loaded in advance by each worker,
+        only used if num_workers > 0
+    compile_model : bool, default=False
+        whether the network is compiled with torch.compile after it is
+        built, specializing the graph to the fixed seq_len and pred_len,
+        requires torch>=2.0
+    precision : str, default="fp32"
+        numeric precision used for prediction, one of "fp32" or "bf16";
+        "bf16" casts the fitted network to bfloat16 before inference,
+        halving the weight bytes read per forward pass
 
     References
     ----------
@@ -413,6 +525,12 @@ class LTSFNLinearForecaster(BaseDeepNetworkPyTorch):
         optimizer=None,
         optimizer_kwargs=None,
         lr=0.001,
+        num_workers=0,
+        pin_memory=False,
+        persistent_workers=False,
+        prefetch_factor=2,
+        compile_model=False,
+        precision="fp32",
         custom_dataset_train=None,
         custom_dataset_pred=None,
     ):
@@ -429,6 +547,12 @@ class LTSFNLinearForecaster(BaseDeepNetworkPyTorch):
         self.custom_dataset_train = custom_dataset_train
         self.custom_dataset_pred = custom_dataset_pred
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.pin_memory = pin_memory
+        self.persistent_workers = persistent_workers
+        self.prefetch_factor = prefetch_factor
+        self.compile_model = compile_model
+        self.precision = precision
 
         super().__init__(
             num_epochs=num_epochs,
@@ -439,6 +563,12 @@ class LTSFNLinearForecaster(BaseDeepNetworkPyTorch):
             optimizer=optimizer,
             optimizer_kwargs=optimizer_kwargs,
             lr=lr,
+            num_workers=num_workers,
+            pin_memory=pin_memory,
+            persistent_workers=persistent_workers,
+            prefetch_factor=prefetch_factor,
+            compile_model=compile_model,
+            precision=precision,
         )
 
         from sktime.utils.validation._dependencies import _check_soft_dependencies
@@ -495,7 +625,15 @@ class LTSFNLinearForecaster(BaseDeepNetworkPyTorch):
                 "batch_size": 1,
                 "num_epochs": 1,
                 "individual": True,
-            }
+            },
+            {
+                "seq_len": 2,
+                "pred_len": 1,
+                "batch_size": 1,
+                "num_epochs": 1,
+                "compile_model": True,
+                "precision": "bf16",
+            },
         ]
 
         return params
@@ -2,6 +2,7 @@
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 if _check_soft_dependencies("torch", severity="none"):
+    import torch
     import torch.nn as nn
 
     nn_module = nn.Module
@@ -46,6 +47,8 @@ class LTSFLinearNetwork:
     """
 
     class _LTSFLinearNetwork(nn_module):
+        """Attributes shared by the individual and shared-layer variants."""
+
         def __init__(
             self,
             seq_len,
@@ -60,12 +63,12 @@ class LTSFLinearNetwork:
             self.in_channels = in_channels
             self.individual = individual
 
-            if self.individual:
-                self.Linear = nn.ModuleList()
-                for _ in range(self.in_channels):
-                    self.Linear.append(nn.Linear(self.seq_len, self.pred_len))
-            else:
-                self.Linear = nn.Linear(self.seq_len, self.pred_len)
+    class _LTSFLinearNetworkShared(_LTSFLinearNetwork):
+        """LTSF-Linear network with one linear layer shared across channels."""
+
+        def __init__(self, seq_len, pred_len, in_channels, individual):
+            super().__init__(seq_len, pred_len, in_channels, individual)
+            self.Linear = nn.Linear(self.seq_len, self.pred_len)
 
         def forward(self, x):
             """Forward pass for LSTF-Linear Network.
@@ -80,19 +83,39 @@ class LTSFLinearNetwork:
             x : torch.Tensor
                 output of Linear Model. x.shape = [Batch, Output Length, Channel]
             """
-            from torch import zeros
-
-            if self.individual:
-                output = zeros([x.size(0), self.pred_len, x.size(2)], dtype=x.dtype).to(
-                    x.device
-                )
-                for i in range(self.in_channels):
-                    output[:, :, i] = self.Linear[i](x[:, :, i])
-                x = output
-            else:
-                x = self.Linear(x.permute(0, 2, 1)).permute(0, 2, 1)
+            # one einsum instead of permute -> Linear -> permute, which
+            # materializes two contiguous copies of the activations
+            x = torch.einsum(
+                "blc,pl->bpc", x, self.Linear.weight
+            ) + self.Linear.bias.unsqueeze(-1)
             return x  # [Batch, Output Length, Channel]
 
+    class _LTSFLinearNetworkIndividual(_LTSFLinearNetwork):
+        """LTSF-Linear network with a separate linear layer per channel."""
+
+        def __init__(self, seq_len, pred_len, in_channels, individual):
+            from sktime.networks.ltsf.layers import ChannelwiseLinear
+
+            super().__init__(seq_len, pred_len, in_channels, individual)
+            self.Linear = ChannelwiseLinear(
+                self.seq_len, self.pred_len, self.in_channels
+            )._build()
+
+        def forward(self, x):
+            """Forward pass for LSTF-Linear Network.
+
+            Parameters
+            ----------
+            x : torch.Tensor
+                torch.Tensor of shape [Batch, Input Sequence Length, Channel]
+
+            Returns
+            -------
+            x : torch.Tensor
+                output of Linear Model. x.shape = [Batch, Output Length, Channel]
+            """
+            return self.Linear(x)  # [Batch, Output Length, Channel]
+
     def __init__(self, seq_len, pred_len, in_channels=1, individual=False):
         self.seq_len = seq_len
         self.pred_len = pred_len
@@ -100,7 +123,13 @@ class LTSFLinearNetwork:
         self.individual = individual
 
     def _build(self):
-        return self._LTSFLinearNetwork(
+        # the variant is fixed at construction time, so each forward pass
+        # is straight-line code without an `if self.individual:` branch
+        if self.individual:
+            network_cls = self._LTSFLinearNetworkIndividual
+        else:
+            network_cls = self._LTSFLinearNetworkShared
+        return network_cls(
             self.seq_len, self.pred_len, self.in_channels, self.individual
         )
 
@@ -138,6 +167,8 @@ class LTSFDLinearNetwork:
     """
 
     class _LTSFDLinearNetwork(nn_module):
+        """Attributes shared by the individual and shared-layer variants."""
+
         def __init__(
             self,
             seq_len,
@@ -157,15 +188,13 @@ class LTSFDLinearNetwork:
             self.individual = individual
             self.in_channels = in_channels
 
-            if self.individual:
-                self.Linear_Seasonal = nn.ModuleList()
-                self.Linear_Trend = nn.ModuleList()
-                for _ in range(self.in_channels):
-                    self.Linear_Seasonal.append(nn.Linear(self.seq_len, self.pred_len))
-                    self.Linear_Trend.append(nn.Linear(self.seq_len, self.pred_len))
-            else:
-                self.Linear_Seasonal = nn.Linear(self.seq_len, self.pred_len)
-                self.Linear_Trend = nn.Linear(self.seq_len, self.pred_len)
+    class _LTSFDLinearNetworkShared(_LTSFDLinearNetwork):
+        """LTSF-DLinear network with linear layers shared across channels."""
+
+        def __init__(self, seq_len, pred_len, in_channels, individual):
+            super().__init__(seq_len, pred_len, in_channels, individual)
+            self.Linear_Seasonal = nn.Linear(self.seq_len, self.pred_len)
+            self.Linear_Trend = nn.Linear(self.seq_len, self.pred_len)
 
         def forward(self, x):
             """Forward pass for LSTF-DLinear Network.
@@ -180,33 +209,50 @@ class LTSFDLinearNetwork:
             x : torch.Tensor
                 output of Linear Model. x.shape = [Batch, Output Length, Channel]
             """
-            from torch import zeros
+            # x: [Batch, Input length, Channel]
+            seasonal_init, trend_init = self.decompsition(x)
+            # one einsum per component instead of permute -> Linear ->
+            # permute, which materializes contiguous activation copies
+            seasonal_output = torch.einsum(
+                "blc,pl->bpc", seasonal_init, self.Linear_Seasonal.weight
+            ) + self.Linear_Seasonal.bias.unsqueeze(-1)
+            trend_output = torch.einsum(
+                "blc,pl->bpc", trend_init, self.Linear_Trend.weight
+            ) + self.Linear_Trend.bias.unsqueeze(-1)
+            return seasonal_output + trend_output  # [Batch, Output length, Channel]
+
+    class _LTSFDLinearNetworkIndividual(_LTSFDLinearNetwork):
+        """LTSF-DLinear network with separate linear layers per channel."""
+
+        def __init__(self, seq_len, pred_len, in_channels, individual):
+            from sktime.networks.ltsf.layers import ChannelwiseLinear
+
+            super().__init__(seq_len, pred_len, in_channels, individual)
+            self.Linear_Seasonal = ChannelwiseLinear(
+                self.seq_len, self.pred_len, self.in_channels
+            )._build()
+            self.Linear_Trend = ChannelwiseLinear(
+                self.seq_len, self.pred_len, self.in_channels
+            )._build()
+
+        def forward(self, x):
+            """Forward pass for LSTF-DLinear Network.
+
+            Parameters
+            ----------
+            x : torch.Tensor
+                torch.Tensor of shape [Batch, Input Sequence Length, Channel]
 
+            Returns
+            -------
+            x : torch.Tensor
+                output of Linear Model. x.shape = [Batch, Output Length, Channel]
+            """
             # x: [Batch, Input length, Channel]
             seasonal_init, trend_init = self.decompsition(x)
-            seasonal_init, trend_init = seasonal_init.permute(
-                0, 2, 1
-            ), trend_init.permute(0, 2, 1)
-            if self.individual:
-                seasonal_output = zeros(
-                    [seasonal_init.size(0), seasonal_init.size(1), self.pred_len],
-                    dtype=seasonal_init.dtype,
-                ).to(seasonal_init.device)
-                trend_output = zeros(
-                    [trend_init.size(0), trend_init.size(1), self.pred_len],
-                    dtype=trend_init.dtype,
-                ).to(trend_init.device)
-                for i in range(self.in_channels):
-                    seasonal_output[:, i, :] = self.Linear_Seasonal[i](
-                        seasonal_init[:, i, :]
-                    )
-                    trend_output[:, i, :] = self.Linear_Trend[i](trend_init[:, i, :])
-            else:
-                seasonal_output = self.Linear_Seasonal(seasonal_init)
-                trend_output = self.Linear_Trend(trend_init)
-
-            x = seasonal_output + trend_output
-            return x.permute(0, 2, 1)  # to [Batch, Output length, Channel]
+            seasonal_output = self.Linear_Seasonal(seasonal_init)
+            trend_output = self.Linear_Trend(trend_init)
+            return seasonal_output + trend_output  # [Batch, Output length, Channel]
 
     def __init__(self, seq_len, pred_len, in_channels=1, individual=False):
         self.seq_len = seq_len
@@ -215,7 +261,13 @@ class LTSFDLinearNetwork:
         self.individual = individual
 
     def _build(self):
-        return self._LTSFDLinearNetwork(
+        # the variant is fixed at construction time, so each forward pass
+        # is straight-line code without an `if self.individual:` branch
+        if self.individual:
+            network_cls = self._LTSFDLinearNetworkIndividual
+        else:
+            network_cls = self._LTSFDLinearNetworkShared
+        return network_cls(
             self.seq_len, self.pred_len, self.in_channels, self.individual
         )
 
@@ -253,6 +305,8 @@ class LTSFNLinearNetwork:
     """
 
     class _LTSFNLinearNetwork(nn_module):
+        """Attributes shared by the individual and shared-layer variants."""
+
         def __init__(
             self,
             seq_len,
@@ -267,12 +321,12 @@ class LTSFNLinearNetwork:
             self.in_channels = in_channels
             self.individual = individual
 
-            if self.individual:
-                self.Linear = nn.ModuleList()
-                for _ in range(self.in_channels):
-                    self.Linear.append(nn.Linear(self.seq_len, self.pred_len))
-            else:
-                self.Linear = nn.Linear(self.seq_len, self.pred_len)
+    class _LTSFNLinearNetworkShared(_LTSFNLinearNetwork):
+        """LTSF-NLinear network with one linear layer shared across channels."""
+
+        def __init__(self, seq_len, pred_len, in_channels, individual):
+            super().__init__(seq_len, pred_len, in_channels, individual)
+            self.Linear = nn.Linear(self.seq_len, self.pred_len)
 
         def forward(self, x):
             """Forward pass for LSTF-NLinear Network.
@@ -287,20 +341,44 @@ class LTSFNLinearNetwork:
             x : torch.Tensor
                 output of Linear Model. x.shape = [Batch, Output Length, Channel]
             """
-            from torch import zeros
-
             # x: [Batch, Input length, Channel]
             seq_last = x[:, -1:, :].detach()
             x = x - seq_last
-            if self.individual:
-                output = zeros([x.size(0), self.pred_len, x.size(2)], dtype=x.dtype).to(
-                    x.device
-                )
-                for i in range(self.in_channels):
-                    output[:, :, i] = self.Linear[i](x[:, :, i])
-                x = output
-            else:
-                x = self.Linear(x.permute(0, 2, 1)).permute(0, 2, 1)
+            # one einsum instead of permute -> Linear -> permute, which
+            # materializes two contiguous copies of the activations
+            x = torch.einsum(
+                "blc,pl->bpc", x, self.Linear.weight
+            ) + self.Linear.bias.unsqueeze(-1)
+            x = x + seq_last
+            return x  # [Batch, Output length, Channel]
+
+    class _LTSFNLinearNetworkIndividual(_LTSFNLinearNetwork):
+        """LTSF-NLinear network with a separate linear layer per channel."""
+
+        def __init__(self, seq_len, pred_len, in_channels, individual):
+            from sktime.networks.ltsf.layers import ChannelwiseLinear
+
+            super().__init__(seq_len, pred_len, in_channels, individual)
+            self.Linear = ChannelwiseLinear(
+                self.seq_len, self.pred_len, self.in_channels
+            )._build()
+
+        def forward(self, x):
+            """Forward pass for LSTF-NLinear Network.
+
+            Parameters
+            ----------
+            x : torch.Tensor
+                torch.Tensor of shape [Batch, Input Sequence Length, Channel]
+
+            Returns
+            -------
+            x : torch.Tensor
+                output of Linear Model. x.shape = [Batch, Output Length, Channel]
+            """
+            # x: [Batch, Input length, Channel]
+            seq_last = x[:, -1:, :].detach()
+            x = self.Linear(x - seq_last)
             x = x + seq_last
             return x  # [Batch, Output length, Channel]
 
@@ -311,6 +389,12 @@ class LTSFNLinearNetwork:
         self.individual = individual
 
     def _build(self):
-        return self._LTSFNLinearNetwork(
+        # the variant is fixed at construction time, so each forward pass
+        # is straight-line code without an `if self.individual:` branch
+        if self.individual:
+            network_cls = self._LTSFNLinearNetworkIndividual
+        else:
+            network_cls = self._LTSFNLinearNetworkShared
+        return network_cls(
             self.seq_len, self.pred_len, self.in_channels, self.individual
         )
@@ -2,7 +2,9 @@
 from sktime.utils.validation._dependencies import _check_soft_dependencies
 
 if _check_soft_dependencies("torch", severity="none"):
+    import torch
     import torch.nn as nn
+    from torch.nn import functional as F
 
     nn_module = nn.Module
 else:
@@ -54,20 +56,84 @@ class MovingAverage:
         def __init__(self, kernel_size, stride):
             super().__init__()
             self.kernel_size = kernel_size
-            self.avg = nn.AvgPool1d(kernel_size=kernel_size, stride=stride, padding=0)
+            self.stride = stride
 
         def forward(self, x):
-            from torch import cat
-
-            # padding on the both ends of time series
-            front = x[:, 0:1, :].repeat(1, (self.kernel_size - 1) // 2, 1)
-            end = x[:, -1:, :].repeat(1, (self.kernel_size - 1) // 2, 1)
-            x = cat([front, x, end], dim=1)
-            x = self.avg(x.permute(0, 2, 1))
-            x = x.permute(0, 2, 1)
+            # replicate padding on both ends of the time series in one fused
+            # kernel, instead of two repeats plus a concat; the transposes
+            # are stride views since pad works on the last dim
+            pad_len = (self.kernel_size - 1) // 2
+            x = F.pad(
+                x.transpose(1, 2), (pad_len, pad_len), mode="replicate"
+            ).transpose(1, 2)
+            # sliding mean via cumulative sums: one O(L) pass independent of
+            # the kernel size instead of the O(L * kernel_size) pooling
+            # kernel, and no permute round-trip since cumsum is dim-agnostic
+            k = self.kernel_size
+            c = x.cumsum(dim=1)
+            x = torch.cat([c[:, k - 1 : k, :], c[:, k:, :] - c[:, :-k, :]], dim=1) / k
+            if self.stride != 1:
+                x = x[:, :: self.stride, :]
             return x
 
 
+class ChannelwiseLinear:
+    """Per-channel linear layer computed as one batched matmul.
+
+    Equivalent to ``in_channels`` independent ``nn.Linear(in_features,
+    out_features)`` modules, one per channel, but evaluated in a single
+    einsum so that no Python loop over channels (and no kernel launch per
+    channel) is needed in the forward pass.
+    """
+
+    def __init__(self, in_features, out_features, in_channels):
+        self.in_features = in_features
+        self.out_features = out_features
+        self.in_channels = in_channels
+
+    def _build(self):
+        return self._ChannelwiseLinear(
+            self.in_features, self.out_features, self.in_channels
+        )
+
+    class _ChannelwiseLinear(nn_module):
+        """Per-channel linear layer computed as one batched matmul."""
+
+        def __init__(self, in_features, out_features, in_channels):
+            super().__init__()
+            self.in_features = in_features
+            self.out_features = out_features
+            self.in_channels = in_channels
+
+            self.weight = nn.Parameter(
+                torch.empty(in_channels, out_features, in_features)
+            )
+            self.bias = nn.Parameter(torch.empty(in_channels, out_features))
+            self.reset_parameters()
+
+        def reset_parameters(self):
+            """Initialize each channel like an independent nn.Linear."""
+            for i in range(self.in_channels):
+                nn.init.kaiming_uniform_(self.weight[i], a=math.sqrt(5))
+            bound = 1 / math.sqrt(self.in_features) if self.in_features > 0 else 0
+            nn.init.uniform_(self.bias, -bound, bound)
+
+        def forward(self, x):
+            """Apply all per-channel linear maps in one einsum.
+
+            Parameters
+            ----------
+            x : torch.Tensor
+                torch.Tensor of shape [Batch, Input Length, Channel]
+
+            Returns
+            -------
+            x : torch.Tensor
+                torch.Tensor of shape [Batch, Output Length, Channel]
+            """
+            return torch.einsum("blc,cpl->bpc", x, self.weight) + self.bias.t()
+
+
 class AutoCorrelation:
     """AutoCorrelation layer.
 
@@ -99,23 +165,23 @@ class AutoCorrelation:
             SpeedUp version of Autocorrelation (a batch-normalization style design)
             This is for the training phase.
             """
-            from torch import mean, roll, softmax, stack, topk, zeros_like
-
             head = values.shape[1]
             channel = values.shape[2]
             length = values.shape[3]
             # find top k
             top_k = int(self.factor * math.log(length))
-            mean_value = mean(mean(corr, dim=1), dim=1)
-            index = topk(mean(mean_value, dim=0), top_k, dim=-1)[1]
-            weights = stack([mean_value[:, index[i]] for i in range(top_k)], dim=-1)
+            mean_value = torch.mean(torch.mean(corr, dim=1), dim=1)
+            index = torch.topk(torch.mean(mean_value, dim=0), top_k, dim=-1)[1]
+            weights = torch.stack(
+                [mean_value[:, index[i]] for i in range(top_k)], dim=-1
+            )
             # update corr
-            tmp_corr = softmax(weights, dim=-1)
+            tmp_corr = torch.softmax(weights, dim=-1)
             # aggregation
             tmp_values = values
-            delays_agg = zeros_like(values).float()
+            delays_agg = torch.zeros_like(values).float()
             for i in range(top_k):
-                pattern = roll(tmp_values, -int(index[i]), -1)
+                pattern = torch.roll(tmp_values, -int(index[i]), -1)
                 delays_agg = delays_agg + pattern * (
                     tmp_corr[:, i]
                     .unsqueeze(1)
@@ -131,15 +197,13 @@ class AutoCorrelation:
             SpeedUp version of Autocorrelation (a batch-normalization style design)
             This is for the inference phase.
             """
-            from torch import arange, gather, mean, softmax, topk, zeros_like
-
             batch = values.shape[0]
             head = values.shape[1]
             channel = values.shape[2]
             length = values.shape[3]
             # index init
             init_index = (
-                arange(length)
+                torch.arange(length)
                 .unsqueeze(0)
                 .unsqueeze(0)
                 .unsqueeze(0)
@@ -148,14 +212,14 @@ class AutoCorrelation:
             )
             # find top k
             top_k = int(self.factor * math.log(length))
-            mean_value = mean(mean(corr, dim=1), dim=1)
-            weights = topk(mean_value, top_k, dim=-1)[0]
-            delay = topk(mean_value, top_k, dim=-1)[1]
+            mean_value = torch.mean(torch.mean(corr, dim=1), dim=1)
+            weights = torch.topk(mean_value, top_k, dim=-1)[0]
+            delay = torch.topk(mean_value, top_k, dim=-1)[1]
             # update corr
-            tmp_corr = softmax(weights, dim=-1)
+            tmp_corr = torch.softmax(weights, dim=-1)
             # aggregation
             tmp_values = values.repeat(1, 1, 1, 2)
-            delays_agg = zeros_like(values).float()
+            delays_agg = torch.zeros_like(values).float()
             for i in range(top_k):
                 tmp_delay = init_index + (
                     delay[:, i]
@@ -164,7 +228,7 @@ class AutoCorrelation:
                     .unsqueeze(1)
                     .repeat(1, head, channel, length)
                 )
-                pattern = gather(tmp_values, dim=-1, index=tmp_delay)
+                pattern = torch.gather(tmp_values, dim=-1, index=tmp_delay)
                 delays_agg = delays_agg + pattern * (
                     tmp_corr[:, i]
                     .unsqueeze(1)
@@ -179,15 +243,13 @@ class AutoCorrelation:
 
             Standard version of Autocorrelation
             """
-            from torch import arange, gather, softmax, topk, zeros_like
-
             batch = values.shape[0]
             head = values.shape[1]
             channel = values.shape[2]
             length = values.shape[3]
             # index init
             init_index = (
-                arange(length)
+                torch.arange(length)
                 .unsqueeze(0)
                 .unsqueeze(0)
                 .unsqueeze(0)
@@ -196,38 +258,36 @@ class AutoCorrelation:
             )
             # find top k
             top_k = int(self.factor * math.log(length))
-            weights = topk(corr, top_k, dim=-1)[0]
-            delay = topk(corr, top_k, dim=-1)[1]
+            weights = torch.topk(corr, top_k, dim=-1)[0]
+            delay = torch.topk(corr, top_k, dim=-1)[1]
             # update corr
-            tmp_corr = softmax(weights, dim=-1)
+            tmp_corr = torch.softmax(weights, dim=-1)
             # aggregation
             tmp_values = values.repeat(1, 1, 1, 2)
-            delays_agg = zeros_like(values).float()
+            delays_agg = torch.zeros_like(values).float()
             for i in range(top_k):
                 tmp_delay = init_index + delay[..., i].unsqueeze(-1)
-                pattern = gather(tmp_values, dim=-1, index=tmp_delay)
+                pattern = torch.gather(tmp_values, dim=-1, index=tmp_delay)
                 delays_agg = delays_agg + pattern * (tmp_corr[..., i].unsqueeze(-1))
             return delays_agg
 
         def forward(self, queries, keys, values, attn_mask):
             """Call model."""
-            from torch import cat, conj, fft, zeros_like
-
             B, L, H, E = queries.shape
             _, S, _, D = values.shape
             if L > S:
-                zeros = zeros_like(queries[:, : (L - S), :]).float()
-                values = cat([values, zeros], dim=1)
-                keys = cat([keys, zeros], dim=1)
+                zeros = torch.zeros_like(queries[:, : (L - S), :]).float()
+                values = torch.cat([values, zeros], dim=1)
+                keys = torch.cat([keys, zeros], dim=1)
             else:
                 values = values[:, :L, :, :]
                 keys = keys[:, :L, :, :]
 
             # period-based dependencies
-            q_fft = fft.rfft(queries.permute(0, 2, 3, 1).contiguous(), dim=-1)
-            k_fft = fft.rfft(keys.permute(0, 2, 3, 1).contiguous(), dim=-1)
-            res = q_fft * conj(k_fft)
-            corr = fft.irfft(res, dim=-1)
+            q_fft = torch.fft.rfft(queries.permute(0, 2, 3, 1).contiguous(), dim=-1)
+            k_fft = torch.fft.rfft(keys.permute(0, 2, 3, 1).contiguous(), dim=-1)
+            res = q_fft * torch.conj(k_fft)
+            corr = torch.fft.irfft(res, dim=-1)
 
             # time delay agg
             if self.training:
@@ -323,10 +383,8 @@ class LTSFLayerNorm:
 
         def forward(self, x):
             """Call layer."""
-            from torch import mean
-
             x_hat = self.layernorm(x)
-            bias = mean(x_hat, dim=1).unsqueeze(1).repeat(1, x.shape[1], 1)
+            bias = torch.mean(x_hat, dim=1).unsqueeze(1).repeat(1, x.shape[1], 1)
             return x_hat - bias
 
     def __init__(self, channels):
@@ -353,8 +411,6 @@ class EncoderLayer:
             activation="relu",
         ):
             super().__init__()
-            from torch.nn.functional import gelu, relu
-
             d_ff = d_ff or 4 * d_model
             self.attention = attention
             self.conv1 = nn.Conv1d(
@@ -366,7 +422,7 @@ class EncoderLayer:
             self.decomp1 = SeriesDecomposer(moving_avg)
             self.decomp2 = SeriesDecomposer(moving_avg)
             self.dropout = nn.Dropout(dropout)
-            self.activation = relu if activation == "relu" else gelu
+            self.activation = F.relu if activation == "relu" else F.gelu
 
         def forward(self, x, attn_mask=None):
             new_x, attn = self.attention(x, x, x, attn_mask=attn_mask)
@@ -465,8 +521,6 @@ class DecoderLayer:
             activation="relu",
         ):
             super().__init__()
-            from torch.nn.functional import gelu, relu
-
             d_ff = d_ff or 4 * d_model
             self.self_attention = self_attention
             self.cross_attention = cross_attention
@@ -489,7 +543,7 @@ class DecoderLayer:
                 padding_mode="circular",
                 bias=False,
             )
-            self.activation = relu if activation == "relu" else gelu
+            self.activation = F.relu if activation == "relu" else F.gelu
 
         def forward(self, x, cross, x_mask=None, cross_mask=None):
             """Call decoder."""
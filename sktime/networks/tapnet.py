@@ -13,6 +13,7 @@ from sktime.utils.validation._dependencies import (
     _check_dl_dependencies,
     _check_soft_dependencies,
 )
+from sktime.utils.warnings import warn
 
 
 class TapNetNetwork(BaseDeepNetwork):
@@ -45,6 +46,21 @@ class TapNetNetwork(BaseDeepNetwork):
         whether to use an LSTM layer
     use_cnn         : bool, default = True
         whether to use a CNN layer
+    lstm_activation : str, default = "tanh"
+        activation function of the LSTM layer
+    lstm_recurrent_activation : str, default = "sigmoid"
+        activation function for the recurrent step of the LSTM layer
+    lstm_recurrent_dropout : float, default = 0.0
+        dropout rate for the recurrent state of the LSTM layer
+    lstm_unroll     : bool, default = False
+        whether to unroll the LSTM, trading memory for speed on short series
+    lstm_use_bias   : bool, default = True
+        whether to use bias in the LSTM layer
+    checkpoint_attention : bool, default = False
+        whether to recompute the attention activations during the backward
+        pass instead of keeping them in memory, trading a second forward
+        pass through attention for a lower peak memory, which allows
+        larger batch sizes
 
     References
     ----------
@@ -52,6 +68,12 @@ class TapNetNetwork(BaseDeepNetwork):
     attentional prototypical network,
     Proceedings of the AAAI Conference on Artificial Intelligence
     34(4), 6845-6852, 2020
+
+    Notes
+    -----
+    The LSTM defaults satisfy the cuDNN fused-kernel criteria; overriding
+    any of them makes tensorflow fall back to the much slower generic
+    GPU kernel, which is warned about at build time.
     """
 
     _tags = {"python_dependencies": ["tensorflow", "keras-self-attention"]}
@@ -70,6 +92,12 @@ class TapNetNetwork(BaseDeepNetwork):
         use_cnn=True,
         random_state=1,
         padding="same",
+        lstm_activation="tanh",
+        lstm_recurrent_activation="sigmoid",
+        lstm_recurrent_dropout=0.0,
+        lstm_unroll=False,
+        lstm_use_bias=True,
+        checkpoint_attention=False,
     ):
         _check_soft_dependencies(
             "keras-self-attention",
@@ -83,7 +111,6 @@ class TapNetNetwork(BaseDeepNetwork):
         self.random_state = random_state
         self.kernel_size = kernel_size
         self.layers = layers
-        self.rp_params = rp_params
         self.filter_sizes = filter_sizes
         self.use_att = use_att
         self.dilation = dilation
@@ -92,6 +119,12 @@ class TapNetNetwork(BaseDeepNetwork):
         self.dropout = dropout
         self.use_lstm = use_lstm
         self.use_cnn = use_cnn
+        self.lstm_activation = lstm_activation
+        self.lstm_recurrent_activation = lstm_recurrent_activation
+        self.lstm_recurrent_dropout = lstm_recurrent_dropout
+        self.lstm_unroll = lstm_unroll
+        self.lstm_use_bias = lstm_use_bias
+        self.checkpoint_attention = checkpoint_attention
 
         # parameters for random projection
         self.use_rp = use_rp
@@ -149,13 +182,16 @@ class TapNetNetwork(BaseDeepNetwork):
         y = tf.broadcast_to(y, shape=(n, m, d))
         return tf.math.reduce_sum(tf.math.pow(x - y, 2), axis=2)
 
-    def build_network(self, input_shape, **kwargs):
+    def build_network(self, input_shape, seed=None, **kwargs):
         """Construct a network and return its input and output layers.
 
         Arguments
         --------
         input_shape: tuple
             The shape of the data fed into the input layer
+        seed: int or None, default = None
+            seed for layer initializers and dropout; per-layer seeds are
+            derived from it, so no tensorflow global seed is touched
 
         Returns
         -------
@@ -166,6 +202,32 @@ class TapNetNetwork(BaseDeepNetwork):
         from keras_self_attention import SeqSelfAttention
         from tensorflow import keras
 
+        seed_rng = None if seed is None else np.random.RandomState(seed)
+
+        def _seed():
+            """Derive the next per-op seed, or None when unseeded."""
+            if seed_rng is None:
+                return None
+            return int(seed_rng.randint(0, 2**31 - 1))
+
+        def _attention(layer):
+            """Optionally recompute the layer's activations on backward.
+
+            The layer keeps ownership of its weights; only its call is
+            wrapped, so the activations are dropped after the forward pass
+            and recomputed when gradients are taken.
+            """
+            if self.checkpoint_attention:
+                recompute = tf.recompute_grad(layer.call)
+
+                # keras passes mask/training kwargs by signature inspection;
+                # recompute_grad cannot take kwargs, and no mask is used here
+                def call(inputs, **kwargs):
+                    return recompute(inputs)
+
+                layer.call = call
+            return layer
+
         input_layer = keras.layers.Input(input_shape)
 
         if self.rp_params[0] < 0:
@@ -176,13 +238,46 @@ class TapNetNetwork(BaseDeepNetwork):
         if self.use_lstm:
             self.lstm_dim = 128
 
-            x_lstm = keras.layers.LSTM(self.lstm_dim, return_sequences=True)(
-                input_layer
+            cudnn_compliant = (
+                self.lstm_activation == "tanh"
+                and self.lstm_recurrent_activation == "sigmoid"
+                and self.lstm_recurrent_dropout == 0.0
+                and not self.lstm_unroll
+                and self.lstm_use_bias
             )
-            x_lstm = keras.layers.Dropout(0.8)(x_lstm)
+            if not cudnn_compliant:
+                warn(
+                    "The LSTM parameters passed to TapNetNetwork do not satisfy "
+                    "the cuDNN fused-kernel criteria (tanh activation, sigmoid "
+                    "recurrent activation, recurrent_dropout=0, unroll=False, "
+                    "use_bias=True); on GPU, tensorflow will fall back to the "
+                    "much slower generic kernel.",
+                    obj=self,
+                )
+
+            x_lstm = keras.layers.LSTM(
+                self.lstm_dim,
+                return_sequences=True,
+                activation=self.lstm_activation,
+                recurrent_activation=self.lstm_recurrent_activation,
+                recurrent_dropout=self.lstm_recurrent_dropout,
+                unroll=self.lstm_unroll,
+                use_bias=self.lstm_use_bias,
+                kernel_initializer=keras.initializers.GlorotUniform(seed=_seed()),
+                recurrent_initializer=keras.initializers.Orthogonal(seed=_seed()),
+            )(input_layer)
+            x_lstm = keras.layers.Dropout(0.8, seed=_seed())(x_lstm)
 
             if self.use_att:
-                x_lstm = SeqSelfAttention(128, attention_type="multiplicative")(x_lstm)
+                x_lstm = _attention(
+                    SeqSelfAttention(
+                        128,
+                        attention_type="multiplicative",
+                        kernel_initializer=keras.initializers.GlorotNormal(
+                            seed=_seed()
+                        ),
+                    )
+                )(x_lstm)
                 # pass
             x_lstm = keras.layers.GlobalAveragePooling1D()(x_lstm)
 
@@ -193,7 +288,8 @@ class TapNetNetwork(BaseDeepNetwork):
                 self.conv_1_models = keras.Sequential()
 
                 for i in range(self.rp_group):
-                    self.idx = np.random.permutation(input_shape[1])[0 : self.rp_dim]
+                    perm_rng = np.random if seed_rng is None else seed_rng
+                    self.idx = perm_rng.permutation(input_shape[1])[0 : self.rp_dim]
                     channel = keras.layers.Lambda(
                         lambda x: tf.gather(x, indices=self.idx, axis=2)
                     )(input_layer)
@@ -205,6 +301,9 @@ class TapNetNetwork(BaseDeepNetwork):
                         dilation_rate=self.dilation,
                         strides=1,
                         padding=self.padding,
+                        kernel_initializer=keras.initializers.GlorotUniform(
+                            seed=_seed()
+                        ),
                     )(
                         channel
                     )  # N * C * L
@@ -218,6 +317,9 @@ class TapNetNetwork(BaseDeepNetwork):
                         dilation_rate=self.dilation,
                         strides=1,
                         padding=self.padding,
+                        kernel_initializer=keras.initializers.GlorotUniform(
+                            seed=_seed()
+                        ),
                     )(x_conv)
                     x_conv = keras.layers.BatchNormalization()(x_conv)
                     x_conv = keras.layers.LeakyReLU()(x_conv)
@@ -228,13 +330,22 @@ class TapNetNetwork(BaseDeepNetwork):
                         dilation_rate=self.dilation,
                         strides=1,
                         padding=self.padding,
+                        kernel_initializer=keras.initializers.GlorotUniform(
+                            seed=_seed()
+                        ),
                     )(x_conv)
                     x_conv = keras.layers.BatchNormalization()(x_conv)
                     x_conv = keras.layers.LeakyReLU()(x_conv)
                     if self.use_att:
-                        x_conv = SeqSelfAttention(128, attention_type="multiplicative")(
-                            x_conv
-                        )
+                        x_conv = _attention(
+                            SeqSelfAttention(
+                                128,
+                                attention_type="multiplicative",
+                                kernel_initializer=keras.initializers.GlorotNormal(
+                                    seed=_seed()
+                                ),
+                            )
+                        )(x_conv)
                         # pass
 
                     x_conv = keras.layers.GlobalAveragePooling1D()(x_conv)
@@ -253,6 +364,7 @@ class TapNetNetwork(BaseDeepNetwork):
                     dilation_rate=self.dilation,
                     strides=1,
                     padding=self.padding,
+                    kernel_initializer=keras.initializers.GlorotUniform(seed=_seed()),
                 )(
                     input_layer
                 )  # N * C * L
@@ -266,6 +378,7 @@ class TapNetNetwork(BaseDeepNetwork):
                     dilation_rate=self.dilation,
                     strides=1,
                     padding=self.padding,
+                    kernel_initializer=keras.initializers.GlorotUniform(seed=_seed()),
                 )(x_conv)
                 x_conv = keras.layers.BatchNormalization()(x_conv)
                 x_conv = keras.layers.LeakyReLU()(x_conv)
@@ -276,11 +389,19 @@ class TapNetNetwork(BaseDeepNetwork):
                     dilation_rate=self.dilation,
                     strides=1,
                     padding=self.padding,
+                    kernel_initializer=keras.initializers.GlorotUniform(seed=_seed()),
                 )(x_conv)
                 x_conv = keras.layers.BatchNormalization()(x_conv)
                 x_conv = keras.layers.LeakyReLU()(x_conv)
                 if self.use_att:
-                    x_conv = SeqSelfAttention(128)(x_conv)
+                    x_conv = _attention(
+                        SeqSelfAttention(
+                            128,
+                            kernel_initializer=keras.initializers.GlorotNormal(
+                                seed=_seed()
+                            ),
+                        )
+                    )(x_conv)
                     # pass
 
                 x_conv = keras.layers.GlobalAveragePooling1D()(x_conv)
@@ -293,10 +414,18 @@ class TapNetNetwork(BaseDeepNetwork):
             x = x_conv
 
         # Mapping section
-        x = keras.layers.Dense(self.layers[0], name="fc_")(x)
+        x = keras.layers.Dense(
+            self.layers[0],
+            name="fc_",
+            kernel_initializer=keras.initializers.GlorotUniform(seed=_seed()),
+        )(x)
         x = keras.layers.LeakyReLU(name="relu_")(x)
         x = keras.layers.BatchNormalization(name="bn_")(x)
 
-        x = keras.layers.Dense(self.layers[1], name="fc_2")(x)
+        x = keras.layers.Dense(
+            self.layers[1],
+            name="fc_2",
+            kernel_initializer=keras.initializers.GlorotUniform(seed=_seed()),
+        )(x)
 
         return input_layer, x
@@ -5,6 +5,7 @@ __all__ = ["TapNetRegressor"]
 
 from copy import deepcopy
 
+import numpy as np
 from sklearn.utils import check_random_state
 
 from sktime.networks.tapnet import TapNetNetwork
@@ -43,7 +44,10 @@ class TapNetRegressor(BaseDeepRegressor):
     loss                : str, default = "mean_squared_error"
         loss function for the classifier
     optimizer           : str or None, default = "Adam(lr=0.01)"
-        gradient updating function for the classifier
+        gradient updating function for the classifier; "lamb" selects
+        the large-batch LAMB optimizer with its learning rate scaled by
+        sqrt(effective batch / 16) and a 5-epoch linear warmup, keeping
+        convergence when batch_size is raised for data-parallel scaling
     use_bias            : bool, default = True
         whether to use bias in the output dense layer
     use_rp              : bool, default = True
@@ -54,10 +58,60 @@ class TapNetRegressor(BaseDeepRegressor):
         whether to use an LSTM layer
     use_cnn         : bool, default = True
         whether to use a CNN layer
-    verbose         : bool, default = False
-        whether to output extra information
+    verbose         : bool or int, default = False
+        whether to output extra information; values of 2 or more also
+        print the model summary after a fresh build
     random_state    : int or None, default = None
         seed for random
+    jit_compile     : bool, default = False
+        whether to compile the model with XLA, fusing elementwise ops into
+        single kernels; compilation fails on ops XLA does not support
+    devices         : list of str or None, default = None
+        devices to mirror training over, e.g. ["/gpu:0", "/gpu:1"]; if
+        given, the model is built under a tf.distribute.MirroredStrategy
+        scope and the batch size is scaled by the number of replicas so
+        the per-replica batch stays constant
+    strategy        : tf.distribute.Strategy or None, default = None
+        distribution strategy to build and train the model under, e.g. a
+        MultiWorkerMirroredStrategy for cross-node data parallelism;
+        takes precedence over devices, and the batch size is scaled by
+        the replica count in the same way
+    mixed_precision : bool, default = False
+        whether to build the model under the mixed_float16 policy, which
+        halves activation/gradient bandwidth on GPUs with float16 support;
+        the output layer and loss stay in float32 for numerical stability
+    early_stopping  : bool, default = False
+        whether to stop training when the loss has stopped improving,
+        restoring the best weights, instead of always running n_epochs;
+        also halves the learning rate when the loss plateaus
+    early_stopping_patience : int, default = 50
+        number of epochs without loss improvement before training stops,
+        only used if early_stopping is True
+    steps_per_execution : int, default = 1
+        number of train steps run per tf.function call, amortizing the
+        Python dispatch overhead across that many batches; values above 1
+        make callbacks and logs fire at that granularity
+    fuse_output_head : bool, default = False
+        whether predict composes the network's final Dense and the
+        output head into a single fused Dense; the two layers are
+        consecutive and linear up to the output activation, so the
+        fused model produces the same output with fewer FLOPs
+    lstm_activation : str, default = "tanh"
+        activation function of the LSTM layer
+    lstm_recurrent_activation : str, default = "sigmoid"
+        activation function for the recurrent step of the LSTM layer
+    lstm_recurrent_dropout : float, default = 0.0
+        dropout rate for the recurrent state of the LSTM layer
+    lstm_unroll     : bool, default = False
+        whether to unroll the LSTM, trading memory for speed on short series
+    lstm_use_bias   : bool, default = True
+        whether to use bias in the LSTM layer; the lstm defaults satisfy
+        the cuDNN fused-kernel criteria, and overriding any of them makes
+        tensorflow fall back to the slower generic GPU kernel
+    checkpoint_attention : bool, default = False
+        whether to recompute the attention activations during the backward
+        pass instead of keeping them in memory, trading a second forward
+        pass through attention for a lower peak memory
 
     References
     ----------
@@ -105,6 +159,20 @@ class TapNetRegressor(BaseDeepRegressor):
         metrics=None,
         callbacks=None,
         verbose=False,
+        jit_compile=False,
+        devices=None,
+        strategy=None,
+        mixed_precision=False,
+        early_stopping=False,
+        early_stopping_patience=50,
+        steps_per_execution=1,
+        fuse_output_head=False,
+        lstm_activation="tanh",
+        lstm_recurrent_activation="sigmoid",
+        lstm_recurrent_dropout=0.0,
+        lstm_unroll=False,
+        lstm_use_bias=True,
+        checkpoint_attention=False,
     ):
         _check_dl_dependencies(severity="error")
 
@@ -112,7 +180,6 @@ class TapNetRegressor(BaseDeepRegressor):
         self.random_state = random_state
         self.kernel_size = kernel_size
         self.layers = layers
-        self.rp_params = rp_params
         self.filter_sizes = filter_sizes
         self.activation = activation
         self.use_att = use_att
@@ -126,6 +193,20 @@ class TapNetRegressor(BaseDeepRegressor):
         self.metrics = metrics
         self.callbacks = callbacks
         self.verbose = verbose
+        self.jit_compile = jit_compile
+        self.devices = devices
+        self.strategy = strategy
+        self.mixed_precision = mixed_precision
+        self.early_stopping = early_stopping
+        self.early_stopping_patience = early_stopping_patience
+        self.steps_per_execution = steps_per_execution
+        self.fuse_output_head = fuse_output_head
+        self.lstm_activation = lstm_activation
+        self.lstm_recurrent_activation = lstm_recurrent_activation
+        self.lstm_recurrent_dropout = lstm_recurrent_dropout
+        self.lstm_unroll = lstm_unroll
+        self.lstm_use_bias = lstm_use_bias
+        self.checkpoint_attention = checkpoint_attention
 
         self.dropout = dropout
         self.use_lstm = use_lstm
@@ -137,20 +218,36 @@ class TapNetRegressor(BaseDeepRegressor):
 
         super().__init__()
 
-        self._network = TapNetNetwork(
-            dropout=self.dropout,
-            filter_sizes=self.filter_sizes,
-            kernel_size=self.kernel_size,
-            dilation=self.dilation,
-            layers=self.layers,
-            use_rp=self.use_rp,
-            rp_params=self.rp_params,
-            use_att=self.use_att,
-            use_lstm=self.use_lstm,
-            use_cnn=self.use_cnn,
-            random_state=self.random_state,
-            padding=self.padding,
-        )
+    @property
+    def _network(self):
+        """Inner TapNetNetwork, constructed lazily on first access.
+
+        Instantiation is deferred so that constructing the estimator, e.g.
+        for sklearn clone in a grid search, does not pay for a network
+        object that is discarded unused.
+        """
+        if getattr(self, "_network_obj", None) is None:
+            self._network_obj = TapNetNetwork(
+                dropout=self.dropout,
+                filter_sizes=self.filter_sizes,
+                kernel_size=self.kernel_size,
+                dilation=self.dilation,
+                layers=self.layers,
+                use_rp=self.use_rp,
+                rp_params=self.rp_params,
+                use_att=self.use_att,
+                use_lstm=self.use_lstm,
+                use_cnn=self.use_cnn,
+                random_state=self.random_state,
+                padding=self.padding,
+                lstm_activation=self.lstm_activation,
+                lstm_recurrent_activation=self.lstm_recurrent_activation,
+                lstm_recurrent_dropout=self.lstm_recurrent_dropout,
+                lstm_unroll=self.lstm_unroll,
+                lstm_use_bias=self.lstm_use_bias,
+                checkpoint_attention=self.checkpoint_attention,
+            )
+        return self._network_obj
 
     def build_model(self, input_shape, **kwargs):
         """Construct a complied, un-trained, keras model that is ready for training.
@@ -172,30 +269,138 @@ class TapNetRegressor(BaseDeepRegressor):
         import tensorflow as tf
         from tensorflow import keras
 
-        tf.random.set_seed(self.random_state)
+        network_seed, head_seed, _ = self._derive_seeds()
+
+        if self.strategy is not None:
+            self._strategy = self.strategy
+        elif self.devices is not None:
+            self._strategy = tf.distribute.MirroredStrategy(self.devices)
+        else:
+            self._strategy = tf.distribute.get_strategy()
+
+        prev_policy = keras.mixed_precision.global_policy()
+        if self.mixed_precision:
+            keras.mixed_precision.set_global_policy("mixed_float16")
+
+        try:
+            with self._strategy.scope():
+                input_layer, output_layer = self._network.build_network(
+                    input_shape, seed=network_seed, **kwargs
+                )
+
+                # the output layer is kept in float32 under mixed precision
+                # so the regression output does not round to float16
+                output_layer = keras.layers.Dense(
+                    units=1,
+                    activation=self.activation,
+                    use_bias=self.use_bias,
+                    dtype="float32" if self.mixed_precision else None,
+                    kernel_initializer=keras.initializers.GlorotUniform(seed=head_seed),
+                )(output_layer)
+
+                model = keras.models.Model(inputs=input_layer, outputs=output_layer)
+                self._compile_model(model)
+        finally:
+            if self.mixed_precision:
+                keras.mixed_precision.set_global_policy(prev_policy)
 
-        metrics = ["mean_squared_error"] if self.metrics is None else self.metrics
+        return model
 
-        input_layer, output_layer = self._network.build_network(input_shape, **kwargs)
+    @staticmethod
+    def _seed_state_variables(model):
+        """Stateful seed-generator variables, advanced by each dropout draw.
 
-        output_layer = keras.layers.Dense(
-            units=1, activation=self.activation, use_bias=self.use_bias
-        )(output_layer)
+        Variable.path only exists on keras 3; on keras 2 (tensorflow
+        < 2.16) seeding is driven by the graph-level seed instead and no
+        such variables are tracked, so falling back to the name matches
+        nothing there, which is correct.
+        """
+        return [
+            v for v in model.variables if "seed_generator" in getattr(v, "path", v.name)
+        ]
+
+    def _derive_seeds(self):
+        """Derive the per-op seeds for the network, head and data shuffle.
+
+        Uses a local generator instead of resetting the process-wide
+        seed via tf.random.set_seed, which serializes seed rehashing
+        across every subsequent op and leaks into other estimators in
+        the same process. Returns a tuple of three Nones when
+        random_state is not set.
+        """
+        import tensorflow as tf
 
-        self.optimizer_ = (
-            keras.optimizers.Adam(learning_rate=0.01)
-            if self.optimizer is None
-            else self.optimizer
+        if self.random_state is None:
+            return (None, None, None)
+        seed_source = tf.random.Generator.from_seed(self.random_state)
+        return tuple(
+            int(s & 0x7FFFFFFF)
+            for s in seed_source.uniform_full_int([3], dtype=tf.int32).numpy()
         )
 
-        model = keras.models.Model(inputs=input_layer, outputs=output_layer)
-        model.compile(
-            loss=self.loss,
-            optimizer=self.optimizer_,
-            metrics=metrics,
-        )
+    def _compile_model(self, model):
+        """Resolve the optimizer and compile the model in place.
 
-        return model
+        Runs after a fresh build, and again on a model-cache hit so the
+        refit starts with a newly initialized optimizer instead of
+        inheriting moments and the iteration counter from the previous
+        fit.
+        """
+        from tensorflow import keras
+
+        metrics = ["mean_squared_error"] if self.metrics is None else self.metrics
+
+        prev_policy = keras.mixed_precision.global_policy()
+        if self.mixed_precision:
+            keras.mixed_precision.set_global_policy("mixed_float16")
+        try:
+            optimizer = "adam" if self.optimizer is None else self.optimizer
+            if not isinstance(optimizer, str):
+                self.optimizer_ = optimizer
+            elif optimizer.lower() == "adam":
+                # epsilon well above the float16/XLA rounding floor
+                # keeps the update step fusable and stable under
+                # mixed precision
+                self.optimizer_ = keras.optimizers.Adam(
+                    learning_rate=0.01, epsilon=1e-4
+                )
+            elif optimizer.lower() == "lamb":
+                if not hasattr(keras.optimizers, "Lamb"):
+                    raise ValueError(
+                        "optimizer='lamb' requires a keras version that "
+                        "provides keras.optimizers.Lamb"
+                    )
+                # layerwise-adaptive LAMB tolerates large effective
+                # batches, so the learning rate scales with the
+                # square root of the batch growth over the default 16
+                self.optimizer_ = keras.optimizers.Lamb(
+                    learning_rate=self._lamb_learning_rate()
+                )
+            else:
+                # any other string is resolved by keras at compile time
+                self.optimizer_ = optimizer
+
+            compile_kwargs = {}
+            if self.jit_compile:
+                compile_kwargs["jit_compile"] = True
+            # under mixed_float16, compile wraps the optimizer in a
+            # LossScaleOptimizer itself, guarding against gradient
+            # underflow without an explicit wrapper here
+            model.compile(
+                loss=self.loss,
+                optimizer=self.optimizer_,
+                metrics=metrics,
+                steps_per_execution=self.steps_per_execution,
+                **compile_kwargs,
+            )
+        finally:
+            if self.mixed_precision:
+                keras.mixed_precision.set_global_policy(prev_policy)
+
+    def _lamb_learning_rate(self):
+        """Learning rate for LAMB, sqrt-scaled with the effective batch."""
+        global_batch = self.batch_size * self._strategy.num_replicas_in_sync
+        return 0.01 * float(np.sqrt(global_batch / 16))
 
     def _fit(self, X, y):
         """Fit the regressor on the training set (X, y).
@@ -211,26 +416,309 @@ class TapNetRegressor(BaseDeepRegressor):
         -------
         self: object
         """
-        # Transpose to conform to expectation format from keras
-        X = X.transpose(0, 2, 1)
+        # Transpose to conform to expectation format from keras; materialize
+        # the transposed layout once as float32 — the dtype the model
+        # computes in anyway — so the epoch loop streams contiguous memory
+        # at half the float64 footprint instead of re-copying and
+        # re-casting the strided view every pass
+        X = np.ascontiguousarray(X.transpose(0, 2, 1), dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
 
         check_random_state(self.random_state)
         self.input_shape = X.shape[1:]
 
-        self.model_ = self.build_model(self.input_shape)
-        if self.verbose:
-            self.model_.summary()
+        # rebuilding the model retraces the graph and reruns compilation;
+        # when refitting with the same shape and config (e.g. cross
+        # validation folds), reuse the compiled model and rewind its
+        # weights to the snapshot taken right after the original build.
+        # the double-underscore name makes the cache survive the reset()
+        # that fit performs before calling _fit
+        cache_key = (
+            self.input_shape,
+            repr(sorted(self.get_params(deep=False).items())),
+        )
+        cache = getattr(self, "_model_cache__", None)
+        if cache is None:
+            cache = self._model_cache__ = {}
+        # only reuse models across refits when seeded: rewinding an
+        # unseeded estimator to its first random init would pin every
+        # refit to that one draw, where a rebuild draws fresh
+        if self.random_state is not None and cache_key in cache:
+            self.model_, initial_weights, seed_states, self._strategy = cache[cache_key]
+            self.model_.set_weights(initial_weights)
+            # seed-generator states sit outside get_weights and advance
+            # with every dropout draw; rewinding them makes the refit
+            # consume the same mask sequence as the original fit
+            for var, state in zip(self._seed_state_variables(self.model_), seed_states):
+                var.assign(state)
+            # recompiling re-instantiates the optimizer, so the refit
+            # does not inherit moments or the iteration counter from the
+            # previous fit, and restores the optimizer_ attribute that
+            # reset() removed
+            with self._strategy.scope():
+                self._compile_model(self.model_)
+        else:
+            self.model_ = self.build_model(self.input_shape)
+            if self.random_state is not None:
+                cache[cache_key] = (
+                    self.model_,
+                    self.model_.get_weights(),
+                    [v.numpy() for v in self._seed_state_variables(self.model_)],
+                    self._strategy,
+                )
+            # summary() walks the whole graph; only print it for a freshly
+            # built model and only when explicitly asked for (verbose >= 2),
+            # so repeated fits in a grid search stay quiet and cheap
+            if self.verbose > 1:
+                self.model_.summary()
+        # feed batches through a tf.data pipeline so shuffling/batching run
+        # in the tf runtime and prefetch overlaps the copy of the next batch
+        # with the current train step, instead of Keras slicing the numpy
+        # arrays synchronously every step
+        import tensorflow as tf
+
+        # keep the per-replica batch at self.batch_size when mirroring
+        # over several devices
+        batch_size = self.batch_size * self._strategy.num_replicas_in_sync
+        # the shuffle draws its seed from the same generator as the
+        # per-op build seeds; unseeded it would be the one remaining
+        # source of run-to-run variation under a fixed random_state
+        _, _, shuffle_seed = self._derive_seeds()
+        dataset = (
+            tf.data.Dataset.from_tensor_slices((X, y))
+            .shuffle(len(X), seed=shuffle_seed)
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        callbacks = deepcopy(self.callbacks) if self.callbacks else []
+        if self.early_stopping:
+            from tensorflow import keras
+
+            # stopping on convergence usually saves far more wall time than
+            # any per-step optimization, given the n_epochs=2000 default
+            callbacks.append(
+                keras.callbacks.EarlyStopping(
+                    monitor="loss",
+                    patience=self.early_stopping_patience,
+                    restore_best_weights=True,
+                )
+            )
+            callbacks.append(
+                keras.callbacks.ReduceLROnPlateau(
+                    monitor="loss", factor=0.5, patience=20
+                )
+            )
+        if isinstance(self.optimizer, str) and self.optimizer.lower() == "lamb":
+            from tensorflow import keras
+
+            # linear warmup over the first epochs protects the large-batch
+            # updates while LAMB's layerwise statistics settle; scheduled
+            # per epoch since step counts are unknown when the model is
+            # built, and recomputed from the config so cached models do
+            # not carry a stale rate into the next fit
+            base_lr = self._lamb_learning_rate()
+            callbacks.append(
+                keras.callbacks.LearningRateScheduler(
+                    lambda epoch: base_lr * min(1.0, (epoch + 1) / 5)
+                )
+            )
         self.history = self.model_.fit(
-            X,
-            y,
-            batch_size=self.batch_size,
+            dataset,
             epochs=self.n_epochs,
             verbose=self.verbose,
-            callbacks=deepcopy(self.callbacks) if self.callbacks else [],
+            callbacks=callbacks,
         )
 
         return self
 
+    def _predict(self, X, **kwargs):
+        """Find regression estimate for all cases in X.
+
+        Runs the forward pass as one traced tf.function over the full test
+        tensor, skipping the per-batch Python dispatch of model.predict.
+        The leading dimension of the signature is left open so varying test
+        set sizes reuse the same trace.
+
+        Parameters
+        ----------
+        X : an np.ndarray of shape = (n_instances, n_dimensions, series_length)
+            The training input samples.
+
+        Returns
+        -------
+        predictions : 1d numpy array
+            array of predictions of each instance
+        """
+        import tensorflow as tf
+
+        X = np.ascontiguousarray(X.transpose((0, 2, 1)), dtype=np.float32)
+
+        model = self.model_
+        if self.fuse_output_head:
+            if getattr(self, "_fused_model", None) is None:
+                self._fused_model = self._fuse_output_head() or self.model_
+            model = self._fused_model
+
+        predict_fn = getattr(self, "_predict_fn", None)
+        if predict_fn is None:
+            predict_fn = tf.function(
+                lambda x: model(x, training=False),
+                jit_compile=True if self.jit_compile else None,
+                input_signature=[tf.TensorSpec([None, *self.input_shape], tf.float32)],
+            )
+            self._predict_fn = predict_fn
+        y_pred = predict_fn(tf.convert_to_tensor(X)).numpy()
+        return np.squeeze(y_pred, axis=-1)
+
+    def _fuse_output_head(self):
+        """Compose the last network Dense and the output head into one Dense.
+
+        ``build_network`` ends in a linear Dense (``fc_2``) which
+        ``build_model`` follows with the single-unit output head, linear
+        up to the output activation. Two consecutive linear layers
+        collapse into one matmul, W = W1 @ W2 and b = b1 @ W2 + b2, so
+        inference can run a single Dense with identical output at
+        roughly half the final-block FLOPs.
+
+        Returns
+        -------
+        keras.Model with the fused head, sharing all earlier layers with
+        ``self.model_``, or None if the layers cannot be fused
+        """
+        from tensorflow import keras
+
+        try:
+            inner = self.model_.get_layer("fc_2")
+        except ValueError:
+            return None
+        head = self.model_.layers[-1]
+        if inner.activation is not keras.activations.linear:
+            return None
+
+        w1 = inner.kernel.numpy()
+        w2 = head.kernel.numpy()
+        w = w1 @ w2
+        b = np.zeros(w.shape[1], dtype=w.dtype)
+        if inner.use_bias:
+            b = inner.bias.numpy() @ w2
+        if head.use_bias:
+            b = b + head.bias.numpy()
+
+        fused = keras.layers.Dense(
+            head.units, activation=head.activation, name="fused_head"
+        )
+        output_layer = fused(inner.input)
+        model = keras.models.Model(inputs=self.model_.input, outputs=output_layer)
+        fused.set_weights([w, b])
+        return model
+
+    def __getstate__(self):
+        """Get Dict config that will be used when a serialization method is called.
+
+        Returns
+        -------
+        copy : dict, the config to be serialized
+        """
+        copy = super().__getstate__()
+        # the model cache holds live keras models, which do not pickle;
+        # it is repopulated on the next fit
+        copy.pop("_model_cache__", None)
+        # distribution strategies are unpicklable, including the default
+        # single-device strategy; build_model re-derives one from the
+        # strategy/devices parameters, which do serialize
+        copy.pop("_strategy", None)
+        # the traced predict function wraps a local lambda and cannot
+        # pickle; predict rebuilds it lazily
+        copy.pop("_predict_fn", None)
+        # the fused inference model carries the full layer graph that the
+        # base class already strips as model_; predict rebuilds it lazily
+        copy.pop("_fused_model", None)
+        return copy
+
+    def export_aot(self, path, target="x86-64", batch_size=1):
+        """Export the fitted model as an XLA ahead-of-time compiled SavedModel.
+
+        Writes a SavedModel to ``path`` and runs ``saved_model_cli
+        aot_compile_cpu`` on it, producing a header and object file that
+        can be linked into a C++ application and serve predictions
+        without the TensorFlow runtime.
+
+        Ahead-of-time compilation requires a fully defined input shape,
+        so the exported signature is fixed to ``batch_size`` instances
+        per call, unlike the open batch dimension used by ``predict``.
+
+        Requires the ``saved_model_cli`` tool shipped with tensorflow to
+        be on the PATH.
+
+        Parameters
+        ----------
+        path : str
+            directory the SavedModel and the compiled artifacts are
+            written to
+        target : str, default = "x86-64"
+            target architecture; any value other than the default is
+            passed to the compiler as an LLVM target triple, e.g.
+            ``"aarch64-none-linux-gnu"`` for ARM
+        batch_size : int, default = 1
+            number of instances per call in the compiled signature
+
+        Returns
+        -------
+        output_prefix : str
+            path prefix of the generated header and object file
+        """
+        import inspect
+        import os
+        import shutil
+        import subprocess
+
+        import tensorflow as tf
+
+        self.check_is_fitted()
+
+        cli = shutil.which("saved_model_cli")
+        if cli is None:
+            raise RuntimeError(
+                "export_aot requires the saved_model_cli tool shipped with "
+                "tensorflow to be available on the PATH, but it was not found"
+            )
+
+        # the fixed-batch signature needs Model.export to accept
+        # input_signature, added in keras 3.4; older keras raises an
+        # opaque TypeError otherwise
+        export_params = inspect.signature(self.model_.export).parameters
+        if "input_signature" not in export_params:
+            raise RuntimeError(
+                "export_aot requires keras>=3.4, where Model.export accepts "
+                "an input_signature; the installed keras does not support it"
+            )
+
+        self.model_.export(
+            path,
+            input_signature=[
+                tf.TensorSpec([batch_size, *self.input_shape], tf.float32)
+            ],
+        )
+        output_prefix = os.path.join(path, "tapnet_aot")
+        cmd = [
+            cli,
+            "aot_compile_cpu",
+            "--dir",
+            path,
+            "--output_prefix",
+            output_prefix,
+            "--cpp_class",
+            "TapNetPredict",
+            "--tag_set",
+            "serve",
+            "--signature_def_key",
+            "serving_default",
+        ]
+        if target != "x86-64":
+            cmd += ["--target_triple", target]
+        subprocess.run(cmd, check=True)
+        return output_prefix
+
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """Return testing parameter settings for the estimator.
@@ -269,7 +757,22 @@ class TapNetRegressor(BaseDeepRegressor):
             "use_cnn": False,
             "layers": (25, 25),
         }
-        test_params = [param1, param2]
+        # exercises the runtime options: cached seeded refits, early
+        # stopping, multi-step execution, head fusion and checkpointed
+        # attention
+        param3 = {
+            "n_epochs": 3,
+            "batch_size": 4,
+            "filter_sizes": (16, 16, 16),
+            "kernel_size": (3, 3, 1),
+            "layers": (25, 50),
+            "random_state": 42,
+            "early_stopping": True,
+            "steps_per_execution": 2,
+            "fuse_output_head": True,
+            "checkpoint_attention": True,
+        }
+        test_params = [param1, param2, param3]
 
         if _check_soft_dependencies("keras", severity="none"):
             from keras.callbacks import LambdaCallback
@@ -0,0 +1 @@
+"""Deep learning regressor test code."""